@@ -2,10 +2,11 @@
 """
 FPGA vs CPU Performance Benchmark
 
-Compares FPGA hardware accelerator performance against NumPy CPU implementation
-for edge detection and Gaussian blur operations.
+Compares FPGA hardware accelerator performance against a CPU reference
+implementation (OpenCV by default, or vectorized NumPy/SciPy, Numba, or
+OpenCV CUDA when available) for edge detection and Gaussian blur operations.
 
-Measured Results (October 2025):
+Measured Results (October 2025, original unvectorized NumPy/SciPy code):
     - CPU (NumPy): 47.3 ms per frame (edge detection)
     - FPGA: 0.89 ms per frame (edge detection)
     - Speedup: 53.1x
@@ -14,15 +15,65 @@ Author: Zeke Mohammed
 Date: October 2025
 """
 
+import os
 import time
+import functools
 import argparse
+from timeit import Timer
 from pathlib import Path
 import numpy as np
 import cv2
 from scipy import ndimage
+import matplotlib
+# Backend configured by the user (MPLBACKEND / matplotlibrc), read without
+# triggering auto-selection, so --show can restore it after forcing Agg
+_CONFIGURED_MPL_BACKEND = dict.__getitem__(matplotlib.rcParams, 'backend')
+# Headless backend by default; main() switches back for --show
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Tuple
+
+try:
+    import numba
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional; the 'numba' backend is only offered when installed
+    njit = None
+
+
+# 3x3 Gaussian kernel as its separable 1-D factor ([1, 2, 1] x [1, 2, 1] / 16),
+# built once rather than on every call
+_GAUSS_1D = np.array([1, 2, 1], dtype=np.float32) / 4.0
+
+
+# Markdown report layout, filled in once by Benchmark.generate_report
+_REPORT_TEMPLATE = """\
+# FPGA Image Processing Benchmark Results
+Generated: {now}
+
+## System Configuration
+- FPGA: Xilinx Artix-7 (XC7A35T)
+- Clock Frequency: {freq:.1f} MHz
+- Image Resolution: 640×480
+- CPU: Intel i7-10700K @ 3.8GHz
+- CPU Backend: {backend} ({threads} threads)
+- NumPy Version: {np_ver}
+- OpenCV Version: {cv_ver}
+
+## Performance Results
+| Operation | CPU Time (ms) | FPGA Time (ms) | Speedup |
+|-----------|--------------|----------------|----------|
+{rows}
+
+**Average Speedup: {avg_speedup:.1f}x**
+
+## Key Findings
+{findings}
+- Deterministic latency (no OS jitter)
+"""
+
+_REPORT_ROW = "| {name:<20} | {cpu_ms:>8.2f} | {fpga_ms:>9.2f} | {speedup:>7.1f}x |"
 
 
 @dataclass
@@ -36,64 +87,375 @@ class BenchmarkResult:
 
 
 class ImageProcessorCPU:
-    """Reference CPU implementation using NumPy/SciPy"""
+    """Reference CPU implementation using OpenCV's SIMD-vectorized filters"""
 
     @staticmethod
-    def sobel_edge_detection(image):
+    def sobel_edge_detection(image, out=None):
         """
         CPU implementation of Sobel edge detection
 
         Args:
             image: Input grayscale image (uint8)
+            out: Optional preallocated output buffer (uint8, same shape)
 
         Returns:
             Edge-detected image (uint8)
         """
-        # Convert to float for processing
-        img_float = image.astype(np.float32)
+        # int16 gradients hold the full ±1020 range of the 3x3 Sobel
+        grad_x = cv2.Sobel(image, cv2.CV_16S, 1, 0, ksize=3, borderType=cv2.BORDER_REPLICATE)
+        grad_y = cv2.Sobel(image, cv2.CV_16S, 0, 1, ksize=3, borderType=cv2.BORDER_REPLICATE)
 
-        # Sobel kernels
-        kernel_x = np.array([[-1, 0, 1],
-                            [-2, 0, 2],
-                            [-1, 0, 1]], dtype=np.float32)
+        # Gradient magnitude (approximation): saturating |.| and uint8 add
+        return cv2.add(cv2.convertScaleAbs(grad_x), cv2.convertScaleAbs(grad_y), dst=out)
 
-        kernel_y = np.array([[-1, -2, -1],
-                            [ 0,  0,  0],
-                            [ 1,  2,  1]], dtype=np.float32)
+    @staticmethod
+    def gaussian_blur(image, out=None):
+        """
+        CPU implementation of 3x3 Gaussian blur
 
-        # Apply convolutions
-        grad_x = ndimage.convolve(img_float, kernel_x)
-        grad_y = ndimage.convolve(img_float, kernel_y)
+        Args:
+            image: Input grayscale image (uint8)
+            out: Optional preallocated output buffer (uint8, same shape)
 
-        # Gradient magnitude (approximation)
-        magnitude = np.abs(grad_x) + np.abs(grad_y)
+        Returns:
+            Blurred image (uint8)
+        """
+        return cv2.GaussianBlur(image, (3, 3), 0, dst=out, borderType=cv2.BORDER_REPLICATE)
 
-        # Normalize to 0-255
-        magnitude = np.clip(magnitude, 0, 255).astype(np.uint8)
 
-        return magnitude
+if njit is not None:
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def _sobel_u8(img, out):
+        """
+        Sobel |gx| + |gy| as separable int16 row passes
+
+        Every intermediate is stored as int16 and each loop is stride-1,
+        so LLVM vectorizes with 16-bit lanes (vpaddw/vpsubw/vpabsw, 16
+        pixels per AVX2 register). inspect_asm() is empty once this loads
+        from the on-disk cache; to check, compile a fresh uncached copy with
+        njit(parallel=True, fastmath=True)(_sobel_u8.py_func), call it, then
+        inspect that
+        """
+        H, W = img.shape
+        diff = np.empty((H, W), np.int16)
+        smooth = np.empty((H, W), np.int16)
+
+        # Horizontal [-1, 0, 1] derivative and [1, 2, 1] smoothing per row
+        # (border columns replicated)
+        for i in prange(H):
+            r = img[i]
+            d = diff[i]
+            s = smooth[i]
+            right = min(1, W - 1)
+            d[0] = np.int16(r[right]) - np.int16(r[0])
+            s[0] = 3 * np.int16(r[0]) + np.int16(r[right])
+            for j in range(1, W - 1):
+                d[j] = np.int16(r[j + 1]) - np.int16(r[j - 1])
+                s[j] = np.int16(r[j - 1]) + 2 * np.int16(r[j]) + np.int16(r[j + 1])
+            if W > 1:
+                d[W - 1] = np.int16(r[W - 1]) - np.int16(r[W - 2])
+                s[W - 1] = np.int16(r[W - 2]) + 3 * np.int16(r[W - 1])
+
+        # Vertical passes complete gx/gy (border rows replicated), then the
+        # saturated magnitude; |gx| + |gy| <= 2040 fits in uint16
+        for i in prange(H):
+            d0, d1, d2 = diff[max(i - 1, 0)], diff[i], diff[min(i + 1, H - 1)]
+            s0, s2 = smooth[max(i - 1, 0)], smooth[min(i + 1, H - 1)]
+            o = out[i]
+            for j in range(W):
+                gx = np.int16(d0[j] + 2 * d1[j] + d2[j])
+                gy = np.int16(s2[j] - s0[j])
+                m = np.uint16(abs(gx)) + np.uint16(abs(gy))
+                o[j] = np.uint8(min(m, np.uint16(255)))
+
+    @njit(parallel=True, fastmath=True, boundscheck=False, cache=True)
+    def _gauss3_u8(img, out):
+        """Separable [1, 2, 1] x [1, 2, 1] / 16 Gaussian in integer arithmetic"""
+        H, W = img.shape
+        tmp = np.empty((H, W), np.uint16)
+
+        # Horizontal [1, 2, 1] pass (at most 4 * 255, fits in uint16)
+        for i in prange(H):
+            r = img[i]
+            t = tmp[i]
+            t[0] = 3 * np.uint16(r[0]) + r[min(1, W - 1)]
+            for j in range(1, W - 1):
+                t[j] = np.uint16(r[j - 1]) + 2 * np.uint16(r[j]) + r[j + 1]
+            if W > 1:
+                t[W - 1] = np.uint16(r[W - 2]) + 3 * np.uint16(r[W - 1])
+
+        # Vertical [1, 2, 1] pass, then divide by 16 (rounded) with a shift
+        for i in prange(H):
+            t0 = tmp[max(i - 1, 0)]
+            t1 = tmp[i]
+            t2 = tmp[min(i + 1, H - 1)]
+            for j in range(W):
+                out[i, j] = (t0[j] + 2 * t1[j] + t2[j] + 8) >> 4
+
+
+class ImageProcessorNumba:
+    """CPU implementation with Numba-compiled integer kernels"""
 
     @staticmethod
-    def gaussian_blur(image):
+    def sobel_edge_detection(image, out=None):
         """
-        CPU implementation of 3x3 Gaussian blur
+        Numba implementation of Sobel edge detection
+
+        Args:
+            image: Input grayscale image (uint8)
+            out: Optional preallocated output buffer (uint8, same shape)
+
+        Returns:
+            Edge-detected image (uint8)
+        """
+        if out is None:
+            out = np.empty_like(image)
+        _sobel_u8(np.ascontiguousarray(image), out)
+        return out
+
+    @staticmethod
+    def gaussian_blur(image, out=None):
+        """
+        Numba implementation of 3x3 Gaussian blur
 
         Args:
             image: Input grayscale image (uint8)
+            out: Optional preallocated output buffer (uint8, same shape)
 
         Returns:
             Blurred image (uint8)
         """
-        # 3x3 Gaussian kernel
-        kernel = np.array([[1, 2, 1],
-                          [2, 4, 2],
-                          [1, 2, 1]], dtype=np.float32) / 16.0
+        if out is None:
+            out = np.empty_like(image)
+        _gauss3_u8(np.ascontiguousarray(image), out)
+        return out
+
+
+class ImageProcessorNumPy:
+    """Vectorized NumPy/SciPy implementation (not the code behind the published numbers)"""
+
+    # Rows per Sobel tile. Tiling bounds the int16 scratch to five
+    # TILE_ROWS x width buffers regardless of frame height; it is not a
+    # cache optimization. On 640x480, 16 and 32 rows are measurably slower
+    # (more per-tile Python overhead), while 64 rows, 128 rows and a single
+    # full-frame tile time within run-to-run noise of each other
+    TILE_ROWS = 64
+
+    def __init__(self):
+        # Scratch buffers owned by this instance: one set per operation,
+        # reallocated only when the image shape changes. Not thread-safe;
+        # use one instance per thread.
+        self._scratch = {}
+
+    def _scratch_buffers(self, operation, shape, make):
+        """
+        Return this instance's scratch buffers for an operation, creating
+        them with make(shape) on first use or when the shape changes
+
+        Args:
+            operation: Operation name
+            shape: Input image shape
+            make: Factory returning a tuple of buffers
+
+        Returns:
+            Tuple of scratch buffers
+        """
+        cached = self._scratch.get(operation)
+        if cached is None or cached[0] != shape:
+            cached = self._scratch[operation] = (shape, make(shape))
+        return cached[1]
+
+    def _sobel_scratch(self, shape):
+        """Padded input plus int16 tile buffers for sobel_edge_detection"""
+        H, W = shape
+        rows = self.TILE_ROWS
+        return (np.empty((H + 2, W + 2), dtype=np.uint8),
+                np.empty((rows + 2, W + 2), dtype=np.int16),
+                np.empty((rows + 2, W), dtype=np.int16),
+                np.empty((rows, W + 2), dtype=np.int16),
+                np.empty((rows, W), dtype=np.int16),
+                np.empty((rows, W), dtype=np.int16))
+
+    @staticmethod
+    def _gauss_scratch(shape):
+        """Two float32 buffers for the separable passes of gaussian_blur"""
+        return (np.empty(shape, dtype=np.float32),
+                np.empty(shape, dtype=np.float32))
+
+    def sobel_edge_detection(self, image, out=None):
+        """
+        NumPy implementation of Sobel edge detection
+
+        Args:
+            image: Input grayscale image (uint8)
+            out: Optional preallocated output buffer (uint8, same shape)
+
+        Returns:
+            Edge-detected image (uint8)
+        """
+        H, W = image.shape
+        rows = self.TILE_ROWS
+
+        # Scratch buffers persist across calls, so repeated frames don't allocate
+        padded, tile_buf, hx_buf, hy_buf, gx_buf, gy_buf = \
+            self._scratch_buffers('sobel', image.shape, self._sobel_scratch)
+        magnitude = np.empty_like(image) if out is None else out
+
+        # Pad one pixel by edge replication (same border as ndimage 'reflect')
+        padded[1:-1, 1:-1] = image
+        padded[0, 1:-1] = image[0]
+        padded[-1, 1:-1] = image[-1]
+        padded[:, 0] = padded[:, 1]
+        padded[:, -1] = padded[:, -2]
+
+        # Process the image in row tiles reusing the fixed-size scratch buffers
+        for top in range(0, H, rows):
+            n = min(rows, H - top)
+            tile = tile_buf[:n + 2]
+            np.copyto(tile, padded[top:top + n + 2])
+
+            # Sobel is separable: [-1, 0, 1] derivative x [1, 2, 1] smoothing
+            hx = np.subtract(tile[:, 2:], tile[:, :-2], out=hx_buf[:n + 2])
+            grad_x = np.add(hx[:-2], hx[2:], out=gx_buf[:n])
+            grad_x += hx[1:-1]
+            grad_x += hx[1:-1]
+
+            hy = np.subtract(tile[2:], tile[:-2], out=hy_buf[:n])
+            grad_y = np.add(hy[:, :-2], hy[:, 2:], out=gy_buf[:n])
+            grad_y += hy[:, 1:-1]
+            grad_y += hy[:, 1:-1]
+
+            # Gradient magnitude (approximation), normalized to 0-255;
+            # |gx| + |gy| <= 2040 so int16 never overflows
+            np.abs(grad_x, out=grad_x)
+            grad_x += np.abs(grad_y, out=grad_y)
+            np.minimum(grad_x, 255, out=grad_x)
+            magnitude[top:top + n] = grad_x
 
-        # Apply convolution
-        blurred = ndimage.convolve(image.astype(np.float32), kernel)
+        return magnitude
+
+    def gaussian_blur(self, image, out=None):
+        """
+        NumPy implementation of 3x3 Gaussian blur
+
+        Args:
+            image: Input grayscale image (uint8)
+            out: Optional preallocated output buffer (uint8, same shape)
+
+        Returns:
+            Blurred image (uint8)
+        """
+        # Apply the separable kernel as two 1-D passes (6 taps instead of 9);
+        # the second pass writes back into the float input buffer
+        img_float, smoothed = self._scratch_buffers('gaussian', image.shape,
+                                                    self._gauss_scratch)
+        np.copyto(img_float, image)
+        ndimage.convolve1d(img_float, _GAUSS_1D, axis=0, output=smoothed)
+        blurred = ndimage.convolve1d(smoothed, _GAUSS_1D, axis=1, output=img_float)
 
         # Convert back to uint8
-        return blurred.astype(np.uint8)
+        if out is None:
+            return blurred.astype(np.uint8)
+        np.copyto(out, blurred, casting='unsafe')
+        return out
+
+
+class ImageProcessorGPU:
+    """CUDA implementation using OpenCV's cv2.cuda filters"""
+
+    def __init__(self):
+        self._stream = cv2.cuda.Stream()
+
+        # Filters are built once and reused for every frame
+        self._sobel_x = cv2.cuda.createSobelFilter(
+            cv2.CV_8U, cv2.CV_16S, 1, 0, ksize=3,
+            rowBorderMode=cv2.BORDER_REPLICATE, columnBorderMode=cv2.BORDER_REPLICATE)
+        self._sobel_y = cv2.cuda.createSobelFilter(
+            cv2.CV_8U, cv2.CV_16S, 0, 1, ksize=3,
+            rowBorderMode=cv2.BORDER_REPLICATE, columnBorderMode=cv2.BORDER_REPLICATE)
+        self._gauss = cv2.cuda.createGaussianFilter(
+            cv2.CV_8U, cv2.CV_8U, (3, 3), 0,
+            rowBorderMode=cv2.BORDER_REPLICATE, columnBorderMode=cv2.BORDER_REPLICATE)
+
+        # Device buffer reused for host images passed to the filters
+        self._src = cv2.cuda_GpuMat()
+
+    @staticmethod
+    def upload(image):
+        """
+        Copy a host image to a new device buffer
+
+        Args:
+            image: Input grayscale image (uint8 numpy array)
+
+        Returns:
+            Device copy of the image (cv2.cuda_GpuMat)
+        """
+        gpu_image = cv2.cuda_GpuMat()
+        gpu_image.upload(image)
+        return gpu_image
+
+    def _on_device(self, image):
+        """Return image as a GpuMat, uploading host arrays on every call"""
+        if isinstance(image, cv2.cuda_GpuMat):
+            return image
+        self._src.upload(image)
+        return self._src
+
+    def sobel_edge_detection(self, image, out=None):
+        """
+        CUDA implementation of Sobel edge detection
+
+        Args:
+            image: Input grayscale image (uint8 numpy array, uploaded on
+                every call, or a cv2.cuda_GpuMat already on the device)
+            out: Optional preallocated output buffer (uint8 cv2.cuda_GpuMat,
+                same size; numpy arrays are not accepted)
+
+        Returns:
+            Edge-detected image (uint8 cv2.cuda_GpuMat, call .download() for host copy)
+        """
+        src = self._on_device(image)
+        grad_x = self._sobel_x.apply(src, stream=self._stream)
+        grad_y = self._sobel_y.apply(src, stream=self._stream)
+
+        # |gx| + |gy| in int16, saturated to uint8 on conversion
+        magnitude = cv2.cuda.add(cv2.cuda.abs(grad_x, stream=self._stream),
+                                 cv2.cuda.abs(grad_y, stream=self._stream),
+                                 stream=self._stream)
+        result = magnitude.convertTo(cv2.CV_8U, dst=out, stream=self._stream)
+
+        self._stream.waitForCompletion()
+        return result
+
+    def gaussian_blur(self, image, out=None):
+        """
+        CUDA implementation of 3x3 Gaussian blur
+
+        Args:
+            image: Input grayscale image (uint8 numpy array, uploaded on
+                every call, or a cv2.cuda_GpuMat already on the device)
+            out: Optional preallocated output buffer (uint8 cv2.cuda_GpuMat,
+                same size; numpy arrays are not accepted)
+
+        Returns:
+            Blurred image (uint8 cv2.cuda_GpuMat, call .download() for host copy)
+        """
+        result = self._gauss.apply(self._on_device(image), dst=out, stream=self._stream)
+
+        self._stream.waitForCompletion()
+        return result
+
+
+# Reference implementations selectable with --backend
+CPU_BACKENDS = {
+    'opencv': ImageProcessorCPU,
+    'numpy': ImageProcessorNumPy,
+}
+if njit is not None:
+    CPU_BACKENDS['numba'] = ImageProcessorNumba
+if hasattr(cv2, 'cuda') and cv2.cuda.getCudaEnabledDeviceCount() > 0:
+    CPU_BACKENDS['cuda'] = ImageProcessorGPU
 
 
 class FPGASimulator:
@@ -115,9 +477,11 @@ class FPGASimulator:
     PIPELINE_LATENCY = 1282        # Cycles (measured)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def estimate_processing_time_ms():
         """
         Calculate FPGA processing time based on actual hardware
+        (depends only on the class constants, so computed once and cached)
 
         Returns:
             Processing time in milliseconds
@@ -137,44 +501,77 @@ class FPGASimulator:
 class Benchmark:
     """Performance benchmark suite"""
 
-    def __init__(self):
-        self.results: List[BenchmarkResult] = []
-
-    def run_cpu_benchmark(self, image, operation, iterations=10):
+    def __init__(self, backend='opencv'):
+        self.backend = backend
+
+        # Results stored column-wise (one list per field) for aggregation
+        self._names: List[str] = []
+        self._cpu_times: List[float] = []
+        self._fpga_times: List[float] = []
+        self._speedups: List[float] = []
+        self._image_sizes: List[tuple] = []
+
+    @property
+    def names(self) -> List[str]:
+        """Operation names, in run order (a copy)"""
+        return list(self._names)
+
+    @property
+    def cpu_times(self) -> np.ndarray:
+        """CPU times in milliseconds"""
+        return np.asarray(self._cpu_times)
+
+    @property
+    def fpga_times(self) -> np.ndarray:
+        """FPGA times in milliseconds"""
+        return np.asarray(self._fpga_times)
+
+    @property
+    def speedups(self) -> np.ndarray:
+        """FPGA speedup over CPU"""
+        return np.asarray(self._speedups)
+
+    @property
+    def results(self) -> Tuple[BenchmarkResult, ...]:
+        """Per-run results as BenchmarkResult records (read-only)"""
+        return tuple(BenchmarkResult(*row) for row in zip(self._names, self._cpu_times,
+                                                          self._fpga_times, self._speedups,
+                                                          self._image_sizes))
+
+    def run_cpu_benchmark(self, image, operation, repeat=5):
         """
         Benchmark CPU implementation
 
         Args:
             image: Input image
-            operation: Function to benchmark
-            iterations: Number of runs for averaging
+            operation: Function to benchmark, called as operation(image, out=buffer)
+            repeat: Number of timing rounds (fastest round is reported)
 
         Returns:
-            Average execution time in milliseconds
+            Execution time per call in milliseconds
         """
-        times = []
+        # Warm-up runs (JIT compilation, thread pool start-up); the result
+        # is then reused as the output buffer for every timed call
+        for _ in range(2):
+            out = operation(image)
 
-        # Warm-up run
-        _ = operation(image)
+        # autorange() picks a loop count that runs for at least 0.2 s,
+        # so sub-millisecond operations aren't limited by timer resolution
+        timer = Timer(lambda: operation(image, out=out))
+        number, _ = timer.autorange()
 
-        # Timed runs
-        for _ in range(iterations):
-            start = time.perf_counter()
-            _ = operation(image)
-            end = time.perf_counter()
-            times.append((end - start) * 1000)  # Convert to ms
+        # Best of several rounds (Timer disables GC while timing)
+        return min(timer.repeat(repeat=repeat, number=number)) * 1000 / number
 
-        # Return average
-        return np.mean(times)
-
-    def run_comparison(self, image, operation_name, cpu_func):
+    def run_comparison(self, image, operation_name, cpu_func, image_size=None):
         """
         Run comparison between CPU and FPGA
 
         Args:
-            image: Test image
+            image: Test image (as accepted by cpu_func)
             operation_name: Name of operation
             cpu_func: CPU implementation function
+            image_size: Image shape for the results (default: image.shape)
 
         Returns:
             BenchmarkResult object
@@ -184,7 +581,7 @@ class Benchmark:
 
         # CPU benchmark
         print("  Running CPU implementation...")
-        cpu_time = self.run_cpu_benchmark(image, cpu_func, iterations=10)
+        cpu_time = self.run_cpu_benchmark(image, cpu_func)
         print(f"  CPU time: {cpu_time:.2f} ms")
 
         # FPGA time (from simulator based on real measurements)
@@ -195,16 +592,52 @@ class Benchmark:
         speedup = cpu_time / fpga_time
         print(f"  Speedup: {speedup:.1f}x")
 
-        result = BenchmarkResult(
+        self._names.append(operation_name)
+        self._cpu_times.append(cpu_time)
+        self._fpga_times.append(fpga_time)
+        self._speedups.append(speedup)
+        if image_size is None:
+            image_size = image.shape
+        self._image_sizes.append(image_size)
+
+        return BenchmarkResult(
             name=operation_name,
             cpu_time_ms=cpu_time,
             fpga_time_ms=fpga_time,
             speedup=speedup,
-            image_size=image.shape
+            image_size=image_size
         )
 
-        self.results.append(result)
-        return result
+    def _key_findings(self):
+        """
+        Summarize the measured results as markdown bullet points
+
+        Returns:
+            Findings text (one '- ' line per finding)
+        """
+        if not self._names:
+            return "- No benchmark results recorded"
+
+        avg_speedup = self.speedups.mean()
+        fpga_ms = self.fpga_times.max()
+
+        if avg_speedup >= 1:
+            comparison = (f"- FPGA is {avg_speedup:.1f}x faster than the "
+                          f"{self.backend} CPU backend on average")
+        else:
+            comparison = (f"- The {self.backend} CPU backend is {1 / avg_speedup:.1f}x "
+                          f"faster than the FPGA on average")
+
+        if fpga_ms < 1000 / 60:
+            realtime = f"- FPGA sustains {1000 / fpga_ms:.0f} FPS, above the 60 FPS real-time target"
+        else:
+            realtime = f"- FPGA reaches {1000 / fpga_ms:.0f} FPS, below the 60 FPS real-time target"
+
+        return '\n'.join([
+            f"- FPGA processes a frame in {fpga_ms:.2f} ms",
+            comparison,
+            realtime,
+        ])
 
     def generate_report(self, save_path=None):
         """
@@ -213,34 +646,22 @@ class Benchmark:
         Args:
             save_path: Path to save report (optional)
         """
-        report = []
-        report.append("# FPGA Image Processing Benchmark Results\n")
-        report.append(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        report.append("\n## System Configuration\n")
-        report.append(f"- FPGA: Xilinx Artix-7 (XC7A35T)\n")
-        report.append(f"- Clock Frequency: {FPGASimulator.CLOCK_FREQ_MHZ:.1f} MHz\n")
-        report.append(f"- Image Resolution: 640×480\n")
-        report.append(f"- CPU: Intel i7-10700K @ 3.8GHz\n")
-        report.append(f"- NumPy Version: {np.__version__}\n")
-
-        report.append("\n## Performance Results\n")
-        report.append("| Operation | CPU Time (ms) | FPGA Time (ms) | Speedup |\n")
-        report.append("|-----------|--------------|----------------|----------|\n")
-
-        for result in self.results:
-            report.append(f"| {result.name:<20} | {result.cpu_time_ms:>8.2f} | "
-                         f"{result.fpga_time_ms:>9.2f} | {result.speedup:>7.1f}x |\n")
-
-        avg_speedup = np.mean([r.speedup for r in self.results])
-        report.append(f"\n**Average Speedup: {avg_speedup:.1f}x**\n")
-
-        report.append("\n## Key Findings\n")
-        report.append("- FPGA achieves consistent sub-millisecond processing times\n")
-        report.append("- 50x+ speedup over optimized NumPy implementation\n")
-        report.append("- Real-time processing at 60 FPS with overhead margin\n")
-        report.append("- Deterministic latency (no OS jitter)\n")
-
-        report_text = ''.join(report)
+        rows = '\n'.join(
+            _REPORT_ROW.format(name=name, cpu_ms=cpu_ms, fpga_ms=fpga_ms, speedup=speedup)
+            for name, cpu_ms, fpga_ms, speedup in zip(self._names, self._cpu_times,
+                                                      self._fpga_times, self._speedups))
+
+        report_text = _REPORT_TEMPLATE.format(
+            now=time.strftime('%Y-%m-%d %H:%M:%S'),
+            freq=FPGASimulator.CLOCK_FREQ_MHZ,
+            backend=self.backend,
+            threads=cv2.getNumThreads(),
+            np_ver=np.__version__,
+            cv_ver=cv2.__version__,
+            rows=rows,
+            avg_speedup=self.speedups.mean() if self._names else float('nan'),
+            findings=self._key_findings(),
+        )
 
         # Print to console
         print("\n" + "=" * 70)
@@ -256,6 +677,35 @@ class Benchmark:
         return report_text
 
 
+def available_cpus():
+    """
+    Number of CPUs this process may run on (respects cpuset/affinity limits)
+
+    Returns:
+        CPU count
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def configure_threads(threads):
+    """
+    Fix the CPU thread count and pin the process to that many cores
+
+    Args:
+        threads: Number of worker threads (1 = single-threaded reference)
+    """
+    cv2.setNumThreads(threads)
+    if njit is not None:
+        numba.set_num_threads(min(threads, numba.config.NUMBA_NUM_THREADS))
+
+    # Pinning avoids core migration jitter between timed runs (Linux only)
+    if hasattr(os, 'sched_setaffinity'):
+        cpus = sorted(os.sched_getaffinity(0))[:threads]
+        os.sched_setaffinity(0, cpus)
+
+
 def main():
     """Main benchmark execution"""
     parser = argparse.ArgumentParser(description="FPGA vs CPU Performance Benchmark")
@@ -263,8 +713,18 @@ def main():
     parser.add_argument('--output', type=Path, default=Path('benchmark_results.md'),
                        help='Output report file')
     parser.add_argument('--plot', action='store_true', help='Generate comparison plots')
+    parser.add_argument('--show', action='store_true',
+                       help='Also display plots in a window (requires --plot and a display)')
+    parser.add_argument('--backend', choices=sorted(CPU_BACKENDS), default='opencv',
+                       help='CPU reference implementation (default: opencv)')
+    parser.add_argument('--seed', type=int, default=0xC0FFEE,
+                       help='Seed for the synthetic test image (default: 0xC0FFEE)')
+    parser.add_argument('--threads', type=int, default=available_cpus(),
+                       help='CPU threads for OpenCV/Numba (default: all available cores, 1 for single-threaded)')
 
     args = parser.parse_args()
+    if args.threads < 1:
+        parser.error(f"--threads must be at least 1 (got {args.threads})")
 
     print("=" * 70)
     print("FPGA Image Processing Accelerator - Performance Benchmark")
@@ -277,39 +737,52 @@ def main():
         print(f"✓ Loaded test image: {args.image}")
     else:
         # Generate synthetic test image
-        print("✓ Generating synthetic test image...")
-        img = np.random.randint(0, 256, (480, 640), dtype=np.uint8)
+        print(f"✓ Generating synthetic test image (seed {args.seed})...")
+        rng = np.random.default_rng(args.seed)
+        img = rng.integers(0, 256, (480, 640), dtype=np.uint8)
+
+    configure_threads(args.threads)
+    print(f"✓ CPU threads: {args.threads}")
 
     # Initialize benchmark
-    benchmark = Benchmark()
-    cpu = ImageProcessorCPU()
+    benchmark = Benchmark(args.backend)
+    cpu = CPU_BACKENDS[args.backend]()
+    print(f"✓ CPU backend: {args.backend}")
 
     # Run benchmarks
-    benchmark.run_comparison(img, "Sobel Edge Detection", cpu.sobel_edge_detection)
-    benchmark.run_comparison(img, "Gaussian Blur", cpu.gaussian_blur)
+    # Device backends get the image uploaded once, keeping the host-to-device
+    # transfer out of the timed region
+    bench_img = cpu.upload(img) if isinstance(cpu, ImageProcessorGPU) else img
+
+    benchmark.run_comparison(bench_img, "Sobel Edge Detection", cpu.sobel_edge_detection,
+                             image_size=img.shape)
+    benchmark.run_comparison(bench_img, "Gaussian Blur", cpu.gaussian_blur,
+                             image_size=img.shape)
 
     # Generate report
     benchmark.generate_report(args.output)
 
     # Generate plots
     if args.plot:
-        generate_plots(benchmark.results)
+        if args.show:
+            plt.switch_backend(_CONFIGURED_MPL_BACKEND)
+        generate_plots(benchmark, show=args.show)
 
 
-def generate_plots(results: List[BenchmarkResult]):
-    """Generate comparison bar charts"""
+def generate_plots(benchmark: Benchmark, show=False):
+    """Generate comparison bar charts (displayed only if show is set)"""
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
 
-    operations = [r.name for r in results]
-    cpu_times = [r.cpu_time_ms for r in results]
-    fpga_times = [r.fpga_time_ms for r in results]
-    speedups = [r.speedup for r in results]
+    operations = benchmark.names
+    cpu_times = benchmark.cpu_times
+    fpga_times = benchmark.fpga_times
+    speedups = benchmark.speedups
 
     # Plot 1: Execution times
     x = np.arange(len(operations))
     width = 0.35
 
-    bars1 = ax1.bar(x - width/2, cpu_times, width, label='CPU (NumPy)', color='#E74C3C')
+    bars1 = ax1.bar(x - width/2, cpu_times, width, label='CPU', color='#E74C3C')
     bars2 = ax1.bar(x + width/2, fpga_times, width, label='FPGA', color='#2ECC71')
 
     ax1.set_ylabel('Execution Time (ms)', fontweight='bold')
@@ -320,10 +793,8 @@ def generate_plots(results: List[BenchmarkResult]):
     ax1.grid(axis='y', alpha=0.3)
 
     # Add value labels on bars
-    for bar in bars1 + bars2:
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.2f}', ha='center', va='bottom', fontsize=9)
+    ax1.bar_label(bars1, fmt='%.2f', padding=2, fontsize=9)
+    ax1.bar_label(bars2, fmt='%.2f', padding=2, fontsize=9)
 
     # Plot 2: Speedup
     bars3 = ax2.bar(operations, speedups, color='#3498DB', alpha=0.8)
@@ -335,15 +806,15 @@ def generate_plots(results: List[BenchmarkResult]):
     ax2.grid(axis='y', alpha=0.3)
 
     # Add value labels
-    for bar in bars3:
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.1f}x', ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax2.bar_label(bars3, fmt='%.1fx', fontsize=10, fontweight='bold')
 
     plt.tight_layout()
     plt.savefig('docs/images/performance_comparison.png', dpi=150, bbox_inches='tight')
     print("\n✓ Performance plot saved to: docs/images/performance_comparison.png")
-    plt.show()
+
+    if show:
+        plt.show()
+    plt.close(fig)
 
 
 if __name__ == '__main__':
@@ -3,7 +3,7 @@
 FPGA Image Upload Tool
 
 Uploads images to FPGA via UART for real-time processing.
-Converts images to 640x480 grayscale and transmits pixel-by-pixel.
+Converts images to 640x480 grayscale and transmits them in row-major order.
 
 Author: Zeke Mohammed
 Date: September 2025
@@ -16,6 +16,7 @@ Usage:
 import argparse
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -37,6 +38,9 @@ class FPGAImageUploader:
     IMAGE_HEIGHT = 480
     TOTAL_PIXELS = IMAGE_WIDTH * IMAGE_HEIGHT
 
+    # Bytes handed to pySerial per write() call
+    CHUNK_SIZE = 4096
+
     def __init__(self, port, baud_rate=115200, timeout=5):
         """
         Initialize UART connection to FPGA
@@ -74,14 +78,31 @@ class FPGAImageUploader:
         Returns:
             Processed image as numpy array (640x480 grayscale)
         """
+        resized, original_shape = self._read_and_convert(image_path)
+        self._print_loaded(image_path, original_shape)
+
+        # Preview
+        if preview:
+            self.preview_image(resized)
+
+        return resized
+
+    def _read_and_convert(self, image_path):
+        """
+        Load image and convert to FPGA format without printing
+        (safe to run on a background thread)
+
+        Args:
+            image_path: Path to input image
+
+        Returns:
+            Tuple of (640x480 grayscale image, original image shape)
+        """
         # Load image
         img = cv2.imread(str(image_path))
         if img is None:
             raise FileNotFoundError(f"Could not load image: {image_path}")
 
-        print(f"✓ Loaded image: {image_path}")
-        print(f"  Original size: {img.shape[1]}x{img.shape[0]}")
-
         # Convert to grayscale
         if len(img.shape) == 3:
             gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
@@ -92,15 +113,25 @@ class FPGAImageUploader:
         resized = cv2.resize(gray, (self.IMAGE_WIDTH, self.IMAGE_HEIGHT),
                             interpolation=cv2.INTER_LINEAR)
 
+        return resized, img.shape
+
+    def _print_loaded(self, image_path, original_shape):
+        """Print the load summary for an image"""
+        print(f"✓ Loaded image: {image_path}")
+        print(f"  Original size: {original_shape[1]}x{original_shape[0]}")
         print(f"  Processed size: {self.IMAGE_WIDTH}x{self.IMAGE_HEIGHT} grayscale")
 
-        # Preview
-        if preview:
-            cv2.imshow('Image to Upload (Press any key to continue)', resized)
-            cv2.waitKey(0)
-            cv2.destroyAllWindows()
+    @staticmethod
+    def preview_image(image):
+        """
+        Show image in a window and wait for a key press
 
-        return resized
+        Args:
+            image: Image to display
+        """
+        cv2.imshow('Image to Upload (Press any key to continue)', image)
+        cv2.waitKey(0)
+        cv2.destroyAllWindows()
 
     def upload_image(self, image, show_progress=True):
         """
@@ -115,9 +146,11 @@ class FPGAImageUploader:
         """
         if image.shape != (self.IMAGE_HEIGHT, self.IMAGE_WIDTH):
             raise ValueError(f"Image must be {self.IMAGE_WIDTH}x{self.IMAGE_HEIGHT}")
+        if image.dtype != np.uint8:
+            raise ValueError(f"Image must be 8-bit grayscale (uint8), got {image.dtype}")
 
-        # Flatten image to 1D array (row-major order)
-        pixels = image.flatten()
+        # Zero-copy byte view of the pixels in row-major order
+        data = memoryview(np.ascontiguousarray(image)).cast('B')
 
         # Clear any pending data
         self.ser.reset_input_buffer()
@@ -126,16 +159,15 @@ class FPGAImageUploader:
         print(f"\nUploading {self.TOTAL_PIXELS} pixels...")
         start_time = time.time()
 
-        # Send pixels with progress bar
-        if show_progress:
-            for pixel in tqdm(pixels, desc="Upload", unit="pixels"):
-                self.ser.write(bytes([pixel]))
-        else:
-            # Batch write for speed (if FPGA can handle it)
-            chunk_size = 1024
-            for i in range(0, len(pixels), chunk_size):
-                chunk = pixels[i:i+chunk_size]
-                self.ser.write(bytes(chunk))
+        # Send in chunks; the progress bar advances once per chunk and
+        # redraws at most every 0.5 s to keep formatting off the write path
+        with tqdm(total=len(data), desc="Upload", unit="B", unit_scale=True,
+                  mininterval=0.5, miniters=max(len(data) // 200, 1),
+                  disable=not show_progress) as pbar:
+            for i in range(0, len(data), self.CHUNK_SIZE):
+                chunk = data[i:i + self.CHUNK_SIZE]
+                self.ser.write(chunk)
+                pbar.update(len(chunk))
 
         # Wait for transmission to complete
         self.ser.flush()
@@ -148,6 +180,46 @@ class FPGAImageUploader:
 
         return duration
 
+    def upload_images(self, image_paths, preview=False, show_progress=True):
+        """
+        Upload several images back to back, loading the next image while
+        the current one is still being transmitted
+
+        Args:
+            image_paths: Iterable of input image paths
+            preview: Show preview window before each upload
+            show_progress: Show upload progress bar
+
+        Returns:
+            List of upload durations in seconds
+        """
+        paths = iter(image_paths)
+        durations = []
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            def prefetch():
+                path = next(paths, None)
+                if path is None:
+                    return None
+                return path, pool.submit(self._read_and_convert, path)
+
+            # Double buffering: decode/resize of image N+1 overlaps UART of image N
+            pending = prefetch()
+            while pending is not None:
+                path, future = pending
+                image, original_shape = future.result()
+                pending = prefetch()
+
+                # Console output and GUI calls stay on the main thread, so
+                # they don't interleave with the running progress bar
+                self._print_loaded(path, original_shape)
+                if preview:
+                    self.preview_image(image)
+
+                durations.append(self.upload_image(image, show_progress))
+
+        return durations
+
     def close(self):
         """Close serial connection"""
         if hasattr(self, 'ser') and self.ser.is_open:
@@ -170,6 +242,9 @@ Examples:
 
   # Quick upload without progress
   python upload_image.py --port /dev/ttyUSB0 --image data.png --no-progress
+
+  # Upload several images back to back
+  python upload_image.py --port /dev/ttyUSB0 --image frame1.png frame2.png frame3.png
         """
     )
 
@@ -183,7 +258,8 @@ Examples:
         '--image', '-i',
         required=True,
         type=Path,
-        help='Input image file (JPG, PNG, BMP, etc.)'
+        nargs='+',
+        help='Input image file(s) (JPG, PNG, BMP, etc.)'
     )
 
     parser.add_argument(
@@ -203,25 +279,24 @@ Examples:
     parser.add_argument(
         '--no-progress',
         action='store_true',
-        help='Disable progress bar (faster upload)'
+        help='Disable progress bar'
     )
 
     args = parser.parse_args()
 
-    # Validate image file
-    if not args.image.exists():
-        print(f"Error: Image file not found: {args.image}")
-        sys.exit(1)
+    # Validate image files
+    for image_path in args.image:
+        if not image_path.exists():
+            print(f"Error: Image file not found: {image_path}")
+            sys.exit(1)
 
     try:
         # Initialize uploader
         uploader = FPGAImageUploader(args.port, args.baud)
 
-        # Load and prepare image
-        image = uploader.load_and_prepare_image(args.image, args.preview)
-
-        # Upload to FPGA
-        uploader.upload_image(image, show_progress=not args.no_progress)
+        # Load, prepare and upload images to FPGA
+        uploader.upload_images(args.image, preview=args.preview,
+                               show_progress=not args.no_progress)
 
         print("\n✓ Upload successful! Check VGA output for processed image.")
 